@@ -713,11 +713,17 @@ void imlib_draw_string(image_t *img,
 void imlib_draw_event_histogram(image_t *img, ec_event_t *ec_event, int num_events, int gain) {
     switch (img->pixfmt) {
         case PIXFORMAT_GRAYSCALE: {
+            // Pixel event types are 0 (off) and 1 (on) so they can index the delta directly.
+            const int32_t delta_lut[] = {
+                [EC_PIX_OFF_EVENT] = -gain,
+                [EC_PIX_ON_EVENT] = gain
+            };
+
             for (int i = 0; i < num_events; i++) {
-                if (ec_event[i].type == EC_PIX_OFF_EVENT || ec_event[i].type == EC_PIX_ON_EVENT) {
+                uint32_t type = ec_event[i].type;
+                if (type <= EC_PIX_ON_EVENT) {
                     size_t index = (ec_event[i].y * img->w) + ec_event[i].x;
-                    int32_t delta = (ec_event[i].type == EC_PIX_OFF_EVENT) ? -gain : gain;
-                    img->data[index] = __USAT(((int32_t) img->data[index]) + delta, UINT8_T_BITS);
+                    img->data[index] = __USAT(((int32_t) img->data[index]) + delta_lut[type], UINT8_T_BITS);
                 }
             }
         }
@@ -1221,7 +1221,7 @@ static mp_obj_t py_csi_ioctl(size_t n_args, const mp_obj_t *args) {
                 }
 
                 error = omv_csi_ioctl(self->csi, request, array->array);
-                if (error > 0) {
+                if (error >= 0) {
                     ret_obj = mp_obj_new_int(error);
                 }
             }
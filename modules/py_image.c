@@ -1749,10 +1749,11 @@ static MP_DEFINE_CONST_FUN_OBJ_KW(py_image_flood_fill_obj, 2, py_image_flood_fil
 #if (OMV_GENX320_ENABLE == 1)
 static mp_obj_t py_image_draw_event_histogram(size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
     enum {
-        ARG_array, ARG_clear, ARG_brightness, ARG_contrast
+        ARG_array, ARG_count, ARG_clear, ARG_brightness, ARG_contrast
     };
     static const mp_arg_t allowed_args[] = {
         { MP_QSTR_array, MP_ARG_OBJ | MP_ARG_REQUIRED, {.u_rom_obj = MP_ROM_NONE} },
+        { MP_QSTR_count, MP_ARG_INT | MP_ARG_KW_ONLY, {.u_int = -1} },
         { MP_QSTR_clear, MP_ARG_BOOL | MP_ARG_KW_ONLY, {.u_bool = true} },
         { MP_QSTR_brightness, MP_ARG_INT | MP_ARG_KW_ONLY, {.u_int = 128} },
         { MP_QSTR_contrast, MP_ARG_INT | MP_ARG_KW_ONLY, {.u_int = 16} },
@@ -1775,11 +1776,22 @@ static mp_obj_t py_image_draw_event_histogram(size_t n_args, const mp_obj_t *pos
                             MP_ERROR_TEXT("Expected a dense ndarray with shape (N, %d)"), EC_EVENT_SIZE);
     }
 
+    // Draw only the first count events so callers don't need to slice the array.
+    int num_events = array->shape[ULAB_MAX_DIMS - 2];
+
+    if (args[ARG_count].u_int >= 0) {
+        if (args[ARG_count].u_int > num_events) {
+            mp_raise_msg_varg(&mp_type_ValueError,
+                                MP_ERROR_TEXT("Expected count <= %d"), num_events);
+        }
+        num_events = args[ARG_count].u_int;
+    }
+
     if (args[ARG_clear].u_bool) {
         memset(image->data, args[ARG_brightness].u_int, image_size(image));
     }
 
-    imlib_draw_event_histogram(image, array->array, array->shape[ULAB_MAX_DIMS - 2], args[ARG_contrast].u_int);
+    imlib_draw_event_histogram(image, array->array, num_events, args[ARG_contrast].u_int);
     return pos_args[0];
 }
 static MP_DEFINE_CONST_FUN_OBJ_KW(py_image_draw_event_histogram_obj, 1, py_image_draw_event_histogram);
@@ -46,7 +46,8 @@ while True:
     # For each PIX_ON_EVENT, add "contrast" to the bin value;
     # for each PIX_OFF_EVENT, subtract it and clamp to [0, 255].
     # If clear=False, histogram accumulates over multiple calls.
-    img.draw_event_histogram(events[:event_count], clear=True, brightness=128, contrast=64)
+    # Only the first "count" events are drawn, avoiding a slice of the array.
+    img.draw_event_histogram(events, count=event_count, clear=True, brightness=128, contrast=64)
 
     # Push the image to the jpeg buffer for the IDE to pull and display.
     # The IDE pulls frames off the camera at a much lower rate than the
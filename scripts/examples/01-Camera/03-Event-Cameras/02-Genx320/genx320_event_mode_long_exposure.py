@@ -13,6 +13,10 @@ from ulab import numpy as np
 
 EXPOSURE_FRAMES = 30
 
+# Busy scenes saturate the histogram well before EXPOSURE_FRAMES frames,
+# so the image is also cleared once this many events have been drawn.
+EXPOSURE_EVENTS = 100000
+
 # Surface to draw the histogram image on.
 img = image.Image(320, 320, image.GRAYSCALE)
 
@@ -35,6 +39,7 @@ csi0.ioctl(csi.IOCTL_GENX320_SET_MODE, csi.GENX320_MODE_EVENT, events.shape[0])
 
 clock = time.clock()
 i = 0
+n = 0
 while True:
     clock.tick()
 
@@ -43,16 +48,21 @@ while True:
     # Note that old events in the buffer are not cleared to save CPU time.
     event_count = csi0.ioctl(csi.IOCTL_GENX320_READ_EVENTS, events)
 
-    # Clear the image every EXPOSURE_FRAMES frames.
-    c = (i % EXPOSURE_FRAMES) == 0
+    # Clear the image every EXPOSURE_FRAMES frames or EXPOSURE_EVENTS events.
+    c = ((i % EXPOSURE_FRAMES) == 0) or (n >= EXPOSURE_EVENTS)
+    if c:
+        i = 0
+        n = 0
     i += 1
+    n += event_count
 
     # Render events into a histogram image.
     # If clear=True, the image is reset to "brightness" before drawing.
     # For each PIX_ON_EVENT, add "contrast" to the bin value;
     # for each PIX_OFF_EVENT, subtract it and clamp to [0, 255].
     # If clear=False, histogram accumulates over multiple calls.
-    img.draw_event_histogram(events[:event_count], clear=c, brightness=128, contrast=64)
+    # Only the first "count" events are drawn, avoiding a slice of the array.
+    img.draw_event_histogram(events, count=event_count, clear=c, brightness=128, contrast=64)
 
     # Push the image to the jpeg buffer for the IDE to pull and display.
     # The IDE pulls frames off the camera at a much lower rate than the
@@ -112,14 +112,14 @@ def read_state():
 
     if size == 1:  # Grayscale
         fmt = "GRAY"
-        y = np.fromstring(buff, dtype=np.uint8)
+        y = np.frombuffer(buff, dtype=np.uint8)
         buff = np.column_stack((y, y, y))
     elif size == 2: # RGB565
         fmt = "RGB"
-        arr = np.fromstring(buff, dtype=np.uint16)
-        r = (((arr & 0xF800) >>11)*255.0/31.0).astype(np.uint8)
-        g = (((arr & 0x07E0) >>5) *255.0/63.0).astype(np.uint8)
-        b = (((arr & 0x001F) >>0) *255.0/31.0).astype(np.uint8)
+        arr = np.frombuffer(buff, dtype=np.uint16)
+        r = ((((arr & 0xF800) >>11)*255)//31).astype(np.uint8)
+        g = ((((arr & 0x07E0) >>5) *255)//63).astype(np.uint8)
+        b = ((((arr & 0x001F) >>0) *255)//31).astype(np.uint8)
         buff = np.column_stack((r,g,b))
     else: # JPEG
         fmt = "JPEG"
@@ -151,13 +151,13 @@ def fb_dump():
     buff = __serial.read(num_bytes)
 
     if size[2] == 1:  # Grayscale
-        y = np.fromstring(buff, dtype=np.uint8)
+        y = np.frombuffer(buff, dtype=np.uint8)
         buff = np.column_stack((y, y, y))
     elif size[2] == 2: # RGB565
-        arr = np.fromstring(buff, dtype=np.uint16)
-        r = (((arr & 0xF800) >>11)*255.0/31.0).astype(np.uint8)
-        g = (((arr & 0x07E0) >>5) *255.0/63.0).astype(np.uint8)
-        b = (((arr & 0x001F) >>0) *255.0/31.0).astype(np.uint8)
+        arr = np.frombuffer(buff, dtype=np.uint16)
+        r = ((((arr & 0xF800) >>11)*255)//31).astype(np.uint8)
+        g = ((((arr & 0x07E0) >>5) *255)//63).astype(np.uint8)
+        b = ((((arr & 0x001F) >>0) *255)//31).astype(np.uint8)
         buff = np.column_stack((r,g,b))
     else: # JPEG
         try:
@@ -179,17 +179,16 @@ def read_profile():
     record_count, record_size, event_count = read_unpack("<III")
 
     if record_count:
-        offset = 0
-        record_format = f"<5I2Q{event_count}QI"
+        record_struct = struct.Struct(f"<5I2Q{event_count}QI")
         profile_size = record_count * record_size
 
         # Read profiling data
         write_pack("<BBI", __USBDBG_CMD, __USBDBG_PROFILE_DUMP, profile_size)
         profile_data = __serial.read(profile_size)
 
-        for i in range(record_count):
-            # Unpack the record
-            profile = struct.unpack(record_format, profile_data[offset:offset + record_size])
+        for offset in range(0, profile_size, record_size):
+            # Unpack the record in place, without slicing the buffer
+            profile = record_struct.unpack_from(profile_data, offset)
             
             # Parse the profile data
             records.append({
@@ -202,8 +201,6 @@ def read_profile():
                 'total_cycles': profile[6],
                 'events': profile[7:7 + event_count] if event_count > 0 else []
             })
-
-            offset += record_size
         
     return records
 
@@ -9,6 +9,8 @@
 # An example script using pyopenmv to grab the framebuffer.
 
 import sys
+import struct
+import functools
 import numpy as np
 import pygame
 import pyopenmv
@@ -39,23 +41,71 @@ while(True):
     img.flush()
 """
 
-def addr_to_symbol(symbols, address):
-    # Binary search for speed
-    lo, hi = 0, len(symbols) - 1
-    while lo <= hi:
-        mid = (lo + hi) // 2
-        start, end, name = symbols[mid]
-        if start <= address < end:
-            return name
-        elif address < start:
-            hi = mid - 1
+def load_symbols(path):
+    """
+    Load the ELF symbol table as (starts, ends, names, strtab) sorted by start address.
+    Names are string table offsets that get decoded on first lookup.
+    """
+    from elftools.elf.elffile import ELFFile
+
+    with open(path, 'rb') as f:
+        elf = ELFFile(f)
+        symtab = elf.get_section_by_name('.symtab')
+        if not symtab:
+            raise ValueError("No symbol table found in ELF.")
+
+        symtab_data = symtab.data()
+        strtab_data = elf.get_section(symtab['sh_link']).data()
+
+        # Parse the raw symbol entries directly, iter_symbols() is very slow. The entry
+        # layout differs between ELF32 and ELF64, only st_name, st_value and st_size are used.
+        endian = '<' if elf.little_endian else '>'
+        if elf.elfclass == 32:
+            sym_format, value_index, size_index = endian + "IIIBBH", 1, 2
         else:
-            lo = mid + 1
+            sym_format, value_index, size_index = endian + "IBBHQQ", 4, 5
+        sym_format += 'x' * (symtab['sh_entsize'] - struct.calcsize(sym_format))
+
+    symbol_list = []
+    for sym in struct.iter_unpack(sym_format, symtab_data):
+        name_offset, addr, size = sym[0], sym[value_index], sym[size_index]
+        if size > 0 and strtab_data[name_offset]:  # ignore empty symbols
+            symbol_list.append((addr, addr + size, name_offset))
+
+    symbol_list.sort()
+
+    # Store as parallel arrays for np.searchsorted() lookups.
+    return (
+        np.array([start for start, _, _ in symbol_list], dtype=np.uint64),
+        np.array([end for _, end, _ in symbol_list], dtype=np.uint64),
+        [name for _, _, name in symbol_list],
+        strtab_data
+    )
+
+def addr_to_symbol(symbols, address):
+    # Symbols are (starts, ends, names, strtab) sorted by start address.
+    starts, ends, names, strtab = symbols
+    i = np.searchsorted(starts, address, side='right') - 1
+    if i >= 0 and address < ends[i]:
+        name = names[i]
+        if isinstance(name, int):
+            # Decode the name from the string table on first hit.
+            name = strtab[name:strtab.index(b'\0', name)].decode('utf-8', 'replace')
+            names[i] = name
+        return name
     return None
 
-def get_color_by_percentage(percentage, base_color=(220, 220, 220)):
+def symbol_resolver(symbols):
+    """Return a cached address to symbol name lookup for symbols."""
+    @functools.lru_cache(maxsize=4096)
+    def resolve_symbol(address):
+        name = addr_to_symbol(symbols, address)
+        return name if name is not None else f"0x{address:x}"
+    return resolve_symbol
+
+def compute_color_by_percentage(percentage):
     """
-    Return a color based on percentage with fine-grained intensity levels.
+    Compute the color for a percentage >= 1 with fine-grained intensity levels.
     """
     def clamp(value):
         return max(0, min(255, int(value)))
@@ -88,24 +138,43 @@ def get_color_by_percentage(percentage, base_color=(220, 220, 220)):
         # Very low - green
         intensity = (percentage - 2) / 3
         return (clamp(160 + 95 * intensity), clamp(255 - 55 * intensity), clamp(160 + 95 * intensity))
-    elif percentage >= 1:
+    else:
         # Minimal - light blue-green
         intensity = (percentage - 1) / 1
         return (clamp(140 + 120 * intensity), clamp(200 + 55 * intensity), clamp(255 - 95 * intensity))
-    else:
+
+# Colors for 1.0% to 100.0% in 0.1% steps.
+COLOR_LUT = tuple(compute_color_by_percentage(i / 10) for i in range(10, 1001))
+
+def get_color_by_percentage(percentage, base_color=(220, 220, 220)):
+    """
+    Return a color based on percentage with fine-grained intensity levels.
+    """
+    if percentage < 1:
         # Zero or negligible - base color
         return base_color
+    return COLOR_LUT[min(1000, int(percentage * 10)) - 10]
+
+# Rendered text surfaces keyed by (font, text, color), oldest entries are evicted first.
+text_cache = {}
+TEXT_CACHE_SIZE = 2048
+
+def render_text(font, text, color):
+    """Render antialiased text, reusing the surface if it was rendered before."""
+    key = (font, text, color)
+    surface = text_cache.get(key)
+    if surface is None:
+        if len(text_cache) >= TEXT_CACHE_SIZE:
+            del text_cache[next(iter(text_cache))]
+        surface = font.render(text, True, color)
+        text_cache[key] = surface
+    return surface
 
 def draw_rounded_rect(surface, color, rect, radius=5):
     x, y, w, h = rect
     if w <= 0 or h <= 0:
         return
-    pygame.draw.rect(surface, color, (x + radius, y, w - 2*radius, h))
-    pygame.draw.rect(surface, color, (x, y + radius, w, h - 2*radius))
-    pygame.draw.circle(surface, color, (x + radius, y + radius), radius)
-    pygame.draw.circle(surface, color, (x + w - radius, y + radius), radius)
-    pygame.draw.circle(surface, color, (x + radius, y + h - radius), radius)
-    pygame.draw.circle(surface, color, (x + w - radius, y + h - radius), radius)
+    pygame.draw.rect(surface, color, rect, border_radius=radius)
 
 
 def draw_table(overlay_surface, config, title, headers, col_widths):
@@ -116,7 +185,7 @@ def draw_table(overlay_surface, config, title, headers, col_widths):
     pygame.draw.rect(overlay_surface, config['colors']['border'], table_rect, max(1, int(2 * config['scale_factor'])))
     
     # Table title
-    title_text = config['fonts']['title'].render(title, True, config['colors']['header_text'])
+    title_text = render_text(config['fonts']['title'], title, config['colors']['header_text'])
     title_rect = title_text.get_rect()
     title_x = (config['width'] - title_rect.width) // 2
     overlay_surface.blit(title_text, (title_x, int(12 * config['scale_factor'])))
@@ -133,7 +202,7 @@ def draw_table(overlay_surface, config, title, headers, col_widths):
     # Draw header text and separators
     current_x = int(10 * config['scale_factor'])
     for i, (header, width) in enumerate(zip(headers, col_widths)):
-        header_surface = config['fonts']['header'].render(header, True, config['colors']['header_text'])
+        header_surface = render_text(config['fonts']['header'], header, config['colors']['header_text'])
         overlay_surface.blit(header_surface, (current_x, header_y + int(6 * config['scale_factor'])))
         
         if i < len(headers) - 1:
@@ -143,114 +212,232 @@ def draw_table(overlay_surface, config, title, headers, col_widths):
         current_x += width
 
 
-def draw_event_table(overlay_surface, config, profile_data, profile_mode, symbols):
+def profile_to_arrays(records):
+    """Convert profile records into numpy columns, one row per record."""
+    num_events = len(records[0]['events']) if records else 0
+    return {
+        'address': np.array([r['address'] for r in records], dtype=np.uint64),
+        'caller': np.array([r['caller'] for r in records], dtype=np.uint64),
+        'call_count': np.array([r['call_count'] for r in records], dtype=np.int64),
+        'min_ticks': np.array([r['min_ticks'] for r in records], dtype=np.int64),
+        'max_ticks': np.array([r['max_ticks'] for r in records], dtype=np.int64),
+        'total_ticks': np.array([r['total_ticks'] for r in records], dtype=np.int64),
+        'total_cycles': np.array([r['total_cycles'] for r in records], dtype=np.int64),
+        'events': np.array([r['events'] for r in records], dtype=np.int64).reshape(len(records), num_events)
+    }
+
+
+def format_scaled(value):
+    """Format an event count, scaling values above 1M/1B to M/B."""
+    if value > 1_000_000_000:
+        return f"{value // 1_000_000_000:,}B"
+    elif value > 1_000_000:
+        return f"{value // 1_000_000:,}M"
+    return f"{value:,}"
+
+def top_rows(keys, count):
+    """
+    Return the indices of the count largest keys in descending order. Ties keep their
+    original order, same as a stable sort, but only the selected rows get sorted.
+    """
+    if count >= len(keys):
+        return np.argsort(-keys, kind='stable')
+    if count <= 0:
+        return np.arange(0, dtype=np.intp)
+    threshold = np.partition(keys, len(keys) - count)[len(keys) - count]
+    above = np.flatnonzero(keys > threshold)
+    ties = np.flatnonzero(keys == threshold)[:count - len(above)]
+    rows = np.concatenate((above, ties))
+    return rows[np.lexsort((rows, -keys[rows]))]
+
+def prepare_event_table(profile_data, max_rows):
+    """
+    Sort and format the top max_rows event table rows, cached until the
+    profile data is refreshed.
+    """
+    table = profile_data.get('event_table')
+    if table is None or table['max_rows'] != max_rows:
+        num_events = profile_data['events'].shape[1]
+        avg_events = profile_data['events'] // np.maximum(profile_data['call_count'], 1)[:, None]
+        if not num_events:
+            order = np.argsort(profile_data['address'], kind='stable')[:max_rows]
+        else:
+            order = top_rows(avg_events[:, 0], max_rows)
+
+        # Calculate event totals for percentage calculation
+        sorted_events = avg_events[order]
+        event_totals = avg_events.sum(axis=0)
+        if num_events > 0 and event_totals[0] > 0:
+            percentages = (sorted_events[:, 0] / event_totals[0] * 100).tolist()
+        else:
+            percentages = None
+
+        table = profile_data['event_table'] = {
+            'address': profile_data['address'][order].tolist(),
+            'cells': [list(map(format_scaled, row)) for row in sorted_events.tolist()],
+            'percentages': percentages,
+            'grand_total': int(event_totals.sum()),
+            'max_rows': max_rows
+        }
+    return table
+
+def prepare_profile_table(profile_data, max_rows):
+    """
+    Sort and format the top max_rows profile table rows, cached until the
+    profile data is refreshed.
+    """
+    table = profile_data.get('profile_table')
+    if table is None or table['max_rows'] != max_rows:
+        order = top_rows(profile_data['total_ticks'], max_rows)
+        total_ticks_all = int(profile_data['total_ticks'].sum())
+
+        call_count = profile_data['call_count'][order]
+        has_calls = call_count > 0
+        min_ticks = np.where(has_calls, profile_data['min_ticks'][order], 0)
+        max_ticks = np.where(has_calls, profile_data['max_ticks'][order], 0)
+        total_ticks = profile_data['total_ticks'][order]
+        avg_ticks = total_ticks // np.maximum(call_count, 1)
+        avg_cycles = profile_data['total_cycles'][order] // np.maximum(call_count, 1)
+        percentages = (total_ticks / max(1, total_ticks_all) * 100).tolist()
+
+        total_strs = [f"{t // 1_000_000:,}M" if t > 1_000_000_000 else f"{t:,}" for t in total_ticks.tolist()]
+        table = profile_data['profile_table'] = {
+            'address': profile_data['address'][order].tolist(),
+            'cells': list(map(list, zip(
+                map("{:,}".format, call_count.tolist()),
+                map("{:,}".format, min_ticks.tolist()),
+                map("{:,}".format, max_ticks.tolist()),
+                total_strs,
+                map("{:,}".format, avg_ticks.tolist()),
+                map("{:,}".format, avg_cycles.tolist()),
+                map("{:.1f}%".format, percentages)
+            ))),
+            'percentages': percentages,
+            'total_ticks': total_ticks_all,
+            'max_rows': max_rows
+        }
+    return table
+
+
+# Pre-rendered static table surface keyed by layout, see draw_table_chrome().
+# Each surface is window sized and only one table is shown at a time, so only
+# the current layout is kept.
+chrome_cache = {}
+CHROME_CACHE_SIZE = 1
+
+def draw_table_chrome(overlay_surface, config, title, headers, col_widths,
+                      data_start_y, row_height, visible_rows):
+    """Draw the static parts of a table (background, header, row backgrounds and separators)."""
+    key = (title, tuple(headers), config['width'], config['height'],
+           config['scale_factor'], visible_rows)
+    chrome = chrome_cache.get(key)
+    if chrome is None:
+        chrome = pygame.Surface((config['width'], config['height']), pygame.SRCALPHA)
+        draw_table(chrome, config, title, headers, col_widths)
+
+        for i in range(visible_rows):
+            row_y = data_start_y + i * row_height
+
+            # Draw row background
+            row_color = config['colors']['row_alt'] if i % 2 == 0 else config['colors']['row_normal']
+            row_rect = (int(5 * config['scale_factor']), row_y,
+                       config['width'] - int(10 * config['scale_factor']), row_height)
+            pygame.draw.rect(chrome, row_color, row_rect)
+
+        # Draw column separators, one line spanning all rows per column
+        if visible_rows:
+            current_x = int(10 * config['scale_factor'])
+            data_end_y = data_start_y + visible_rows * row_height
+            for width in col_widths[:-1]:
+                sep_x = current_x + width - int(8 * config['scale_factor'])
+                pygame.draw.line(chrome, (60, 70, 85),
+                               (sep_x, data_start_y), (sep_x, data_end_y), 1)
+                current_x += width
+
+        if len(chrome_cache) >= CHROME_CACHE_SIZE:
+            chrome_cache.clear()
+        chrome_cache[key] = chrome
+
+    overlay_surface.blit(chrome, (0, 0))
+
+
+def draw_event_table(overlay_surface, config, profile_data, profile_mode, resolve_symbol):
     """Draw the event counter mode table."""
 
     # Prepare data
-    num_events = len(profile_data[0]['events']) if profile_data else 0
-    if not num_events:
-        sorted_data = sorted(profile_data, key=lambda x: x['address'])
-    else:
-        sort_func = lambda x: x['events'][0] // max(1, x['call_count'])
-        sorted_data = sorted(profile_data, key=sort_func, reverse=True)
+    num_records, num_events = profile_data['events'].shape
     
     headers = ["Function"] + [f"E{i}" for i in range(num_events)]
     proportions = [0.30] + [0.70/num_events] * num_events
     col_widths = [config['width'] * prop for prop in proportions]
     profile_mode = "Exclusive" if profile_mode else "Inclusive"
     
-    # Calculate event totals for percentage calculation
-    event_totals = [0] * num_events
-    for record in sorted_data:
-        for i, event_count in enumerate(record['events']):
-            event_totals[i] += event_count // max(1, record['call_count'])
-    
     # Draw table structure
-    draw_table(overlay_surface, config, f"Event Counters ({profile_mode})", headers, col_widths)
-    
-    # Draw data rows
     row_height = int(30 * config['scale_factor'])
     data_start_y = int(50 * config['scale_factor'] + 40 * config['scale_factor'] + 8 * config['scale_factor'])
     available_height = config['height'] - data_start_y - int(60 * config['scale_factor'])
-    visible_rows = min(len(sorted_data), available_height // row_height)
+    visible_rows = min(num_records, available_height // row_height)
+    draw_table_chrome(overlay_surface, config, f"Event Counters ({profile_mode})", headers, col_widths,
+                      data_start_y, row_height, visible_rows)
+
+    # Only the visible rows are sorted and formatted.
+    table = prepare_event_table(profile_data, visible_rows)
     
+    # Draw data rows
+    # Cell text is collected and blitted in one call after the rows are drawn.
+    blit_seq = []
     for i in range(visible_rows):
-        record = sorted_data[i]
         row_y = data_start_y + i * row_height
         
-        # Draw row background
-        row_color = config['colors']['row_alt'] if i % 2 == 0 else config['colors']['row_normal']
-        row_rect = (int(5 * config['scale_factor']), row_y, 
-                   config['width'] - int(10 * config['scale_factor']), row_height)
-        pygame.draw.rect(overlay_surface, row_color, row_rect)
-        
         # Function name
-        name = addr_to_symbol(symbols, record['address']) if symbols else "<no symbols>"
+        name = resolve_symbol(table['address'][i]) if resolve_symbol else "<no symbols>"
         max_name_chars = int(col_widths[0] // (11 * config['scale_factor']))
         display_name = name if len(name) <= max_name_chars else name[:max_name_chars - 3] + "..."
         
-        row_data = [display_name]
-        
-        # Event data
-        for j, event_count in enumerate(record['events']):
-            event_scale = ""
-            event_count //= max(1, record['call_count'])
-            if event_count > 1_000_000_000:
-                event_count //= 1_000_000_000
-                event_scale = "B"
-            elif event_count > 1_000_000:
-                event_count //= 1_000_000
-                event_scale = "M"
-            row_data.append(f"{event_count:,}{event_scale}")
+        row_data = [display_name] + table['cells'][i]
         
         # Determine row color based on sorting key (event 0)
-        if len(record['events']) > 0 and event_totals[0] > 0:
-            sort_key_value = record['events'][0] // max(1, record['call_count'])
-            percentage = (sort_key_value / event_totals[0] * 100)
+        if table['percentages'] is not None:
+            percentage = table['percentages'][i]
             row_text_color = get_color_by_percentage(percentage, config['colors']['content_text'])
         else:
             row_text_color = config['colors']['content_text']
         
         # Draw row data with uniform color
-        current_x = 10
-        for j, (data, width) in enumerate(zip(row_data, col_widths)):
-            text_surface = config['fonts']['content'].render(str(data), True, row_text_color)
-            overlay_surface.blit(text_surface, (current_x, row_y + int(8 * config['scale_factor'])))
-            
-            if j < len(row_data) - 1:
-                sep_x = current_x + width - 8
-                pygame.draw.line(overlay_surface, (60, 70, 85),
-                               (sep_x, row_y), (sep_x, row_y + row_height), 1)
+        current_x = int(10 * config['scale_factor'])
+        for data, width in zip(row_data, col_widths):
+            text_surface = render_text(config['fonts']['content'], str(data), row_text_color)
+            blit_seq.append((text_surface, (current_x, row_y + int(8 * config['scale_factor']))))
             current_x += width
+
+    overlay_surface.blits(blit_seq, doreturn=False)
     
     # Draw summary
     summary_y = config['height'] - int(50 * config['scale_factor'])
-    total_functions = len(profile_data)
-    grand_total = sum(event_totals)
+    total_functions = num_records
+    grand_total = table['grand_total']
     summary_text = (
         f"Profiles: {total_functions} | "
         f"Events: {num_events} | "
         f"Total Events: {grand_total:,}"
     )
     
-    summary_surface = config['fonts']['summary'].render(summary_text, True, config['colors']['content_text'])
+    summary_surface = render_text(config['fonts']['summary'], summary_text, config['colors']['content_text'])
     summary_rect = summary_surface.get_rect()
     summary_x = (config['width'] - summary_rect.width) // 2
     overlay_surface.blit(summary_surface, (summary_x, summary_y))
     
     # Instructions
     instruction_str = "Press 'P' to toggle event counter overlay"
-    instruction_text = config['fonts']['instruction'].render(instruction_str, True, (180, 180, 180))
+    instruction_text = render_text(config['fonts']['instruction'], instruction_str, (180, 180, 180))
     overlay_surface.blit(instruction_text, (0, summary_y + int(20 * config['scale_factor'])))
 
 
-def draw_profile_table(overlay_surface, config, profile_data, profile_mode, symbols):
+def draw_profile_table(overlay_surface, config, profile_data, profile_mode, resolve_symbol):
     """Draw the profile mode table."""
 
     # Prepare data
-    sort_func = lambda x: x['total_ticks']
-    sorted_data = sorted(profile_data, key=sort_func, reverse=True)
-    total_ticks_all = sum(record['total_ticks'] for record in profile_data)
+    num_records = len(profile_data['total_ticks'])
     profile_mode = "Exclusive" if profile_mode else "Inclusive"
     
     headers = ["Function", "Calls", "Min", "Max", "Total", "Avg", "Cycles", "%"]
@@ -258,94 +445,77 @@ def draw_profile_table(overlay_surface, config, profile_data, profile_mode, symb
     col_widths = [config['width'] * prop for prop in proportions]
     
     # Draw table structure
-    draw_table(overlay_surface, config, f"Performance Profile ({profile_mode})", headers, col_widths)
-    
-    # Draw data rows
     row_height = int(30 * config['scale_factor'])
     data_start_y = int(50 * config['scale_factor'] + 40 * config['scale_factor'] + 8 * config['scale_factor'])
     available_height = config['height'] - data_start_y - int(60 * config['scale_factor'])
-    visible_rows = min(len(sorted_data), available_height // row_height)
+    visible_rows = min(num_records, available_height // row_height)
+    draw_table_chrome(overlay_surface, config, f"Performance Profile ({profile_mode})", headers, col_widths,
+                      data_start_y, row_height, visible_rows)
+
+    # Only the visible rows are sorted and formatted.
+    table = prepare_profile_table(profile_data, visible_rows)
     
+    # Draw data rows
+    # Cell text is collected and blitted in one call after the rows are drawn.
+    blit_seq = []
     for i in range(visible_rows):
-        record = sorted_data[i]
         row_y = data_start_y + i * row_height
         
-        # Draw row background
-        row_color = config['colors']['row_alt'] if i % 2 == 0 else config['colors']['row_normal']
-        row_rect = (int(5 * config['scale_factor']), row_y, 
-                   config['width'] - int(10 * config['scale_factor']), row_height)
-        pygame.draw.rect(overlay_surface, row_color, row_rect)
-        
         # Function name
-        name = addr_to_symbol(symbols, record['address']) if symbols else "<no symbols>"
+        name = resolve_symbol(table['address'][i]) if resolve_symbol else "<no symbols>"
         max_name_chars = int(col_widths[0] // (11 * config['scale_factor']))
         display_name = name if len(name) <= max_name_chars else name[:max_name_chars - 3] + "..."
         
-        # Calculate values
-        call_count = record['call_count']
-        min_ticks = record['min_ticks'] if call_count else 0
-        max_ticks = record['max_ticks'] if call_count else 0
-        total_ticks = record['total_ticks']
-        avg_cycles = record['total_cycles'] // max(1, call_count)
-        avg_ticks = total_ticks // max(1, call_count)
-        percentage = (total_ticks / total_ticks_all * 100)
-        
-        ticks_scale = ""
-        if total_ticks > 1_000_000_000:
-            total_ticks //= 1_000_000
-            ticks_scale = "M"
-        
-        row_data = [
-            display_name,
-            f"{call_count:,}",
-            f"{min_ticks:,}",
-            f"{max_ticks:,}",
-            f"{total_ticks:,}{ticks_scale}",
-            f"{avg_ticks:,}",
-            f"{avg_cycles:,}",
-            f"{percentage:.1f}%"
-        ]
+        row_data = [display_name] + table['cells'][i]
         
         # Determine row color based on percentage
-        text_color = get_color_by_percentage(percentage, config['colors']['content_text'])
+        text_color = get_color_by_percentage(table['percentages'][i], config['colors']['content_text'])
         
         # Draw row data
         current_x = int(10 * config['scale_factor'])
-        for j, (data, width) in enumerate(zip(row_data, col_widths)):
-            text_surface = config['fonts']['content'].render(str(data), True, text_color)
-            overlay_surface.blit(text_surface, (current_x, row_y + int(8 * config['scale_factor'])))
-            
-            if j < len(row_data) - 1:
-                sep_x = current_x + width - int(8 * config['scale_factor'])
-                pygame.draw.line(overlay_surface, (60, 70, 85),
-                               (sep_x, row_y), (sep_x, row_y + row_height), 1)
+        for data, width in zip(row_data, col_widths):
+            text_surface = render_text(config['fonts']['content'], str(data), text_color)
+            blit_seq.append((text_surface, (current_x, row_y + int(8 * config['scale_factor']))))
             current_x += width
+
+    overlay_surface.blits(blit_seq, doreturn=False)
     
     # Draw summary
     summary_y = config['height'] - int(50 * config['scale_factor'])
-    total_calls = sum(record['call_count'] for record in profile_data)
-    total_cycles = sum(record['total_cycles'] for record in profile_data)
-    total_ticks_summary = sum(record['total_ticks'] for record in profile_data)
+    total_calls = int(profile_data['call_count'].sum())
+    total_cycles = int(profile_data['total_cycles'].sum())
+    total_ticks_summary = table['total_ticks']
     
     summary_text = (
-        f"Profiles: {len(profile_data)} | "
+        f"Profiles: {num_records} | "
         f"Total Calls: {total_calls:,} | "
         f"Total Ticks: {total_ticks_summary:,} | "
         f"Total Cycles: {total_cycles:,}"
     )
     
-    summary_surface = config['fonts']['summary'].render(summary_text, True, config['colors']['content_text'])
+    summary_surface = render_text(config['fonts']['summary'], summary_text, config['colors']['content_text'])
     summary_rect = summary_surface.get_rect()
     summary_x = (config['width'] - summary_rect.width) // 2
     overlay_surface.blit(summary_surface, (summary_x, summary_y))
     
     # Instructions
     instruction_str = "Press 'P' to toggle event counter overlay"
-    instruction_text = config['fonts']['instruction'].render(instruction_str, True, (180, 180, 180))
+    instruction_text = render_text(config['fonts']['instruction'], instruction_str, (180, 180, 180))
     overlay_surface.blit(instruction_text, (0, summary_y + int(20 * config['scale_factor'])))
 
+@functools.lru_cache(maxsize=8)
+def get_fonts(scale_factor):
+    """Return the overlay fonts for scale_factor, SysFont lookups are expensive so they're cached."""
+    return {
+        'title': pygame.font.SysFont("arial", int(28 * scale_factor), bold=True),
+        'header': pygame.font.SysFont("monospace", int(20 * scale_factor), bold=True),
+        'content': pygame.font.SysFont("monospace", int(18 * scale_factor)),
+        'summary': pygame.font.SysFont("arial", int(20 * scale_factor)),
+        'instruction': pygame.font.SysFont("arial", int(22 * scale_factor))
+    }
+
 def draw_profile_overlay(screen, screen_width, screen_height, profile_data,
-                         profile_mode, profile_type, scale, symbols, alpha=250):
+                         profile_mode, profile_type, scale, resolve_symbol, alpha=250):
     """Main entry point for drawing the profile overlay."""
     # Calculate dimensions and create surface
     base_width, base_height = 800, 800
@@ -353,7 +523,22 @@ def draw_profile_overlay(screen, screen_width, screen_height, profile_data,
     screen_height *= scale
     scale_factor = min(screen_width / base_width, screen_height / base_height)
     
-    overlay_surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+    # The overlay only changes when the profile data (refreshed at 10Hz), the mode or
+    # the size changes. Otherwise, the previously drawn overlay is blitted as is.
+    overlay_key = (profile_mode, profile_type, screen_width, screen_height, alpha)
+    overlay_surface = getattr(draw_profile_overlay, "overlay_surface", None)
+    if (overlay_surface is not None and
+            draw_profile_overlay.overlay_data is profile_data and
+            draw_profile_overlay.overlay_key == overlay_key):
+        screen.blit(overlay_surface, (0, 0))
+        return
+
+    # Reuse the overlay surface across frames, it's only re-allocated if the size changes.
+    if overlay_surface is None or overlay_surface.get_size() != (screen_width, screen_height):
+        overlay_surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+        draw_profile_overlay.overlay_surface = overlay_surface
+    else:
+        overlay_surface.fill((0, 0, 0, 0))
     overlay_surface.set_alpha(alpha)
     
     # Setup common configuration
@@ -370,24 +555,20 @@ def draw_profile_overlay(screen, screen_width, screen_height, profile_data,
             'row_alt': (35, 45, 60),
             'row_normal': (45, 55, 70)
         },
-        'fonts': {
-            'title': pygame.font.SysFont("arial", int(28 * scale_factor), bold=True),
-            'header': pygame.font.SysFont("monospace", int(20 * scale_factor), bold=True),
-            'content': pygame.font.SysFont("monospace", int(18 * scale_factor)),
-            'summary': pygame.font.SysFont("arial", int(20 * scale_factor)),
-            'instruction': pygame.font.SysFont("arial", int(22 * scale_factor))
-        }
+        'fonts': get_fonts(scale_factor)
     }
 
     # Draw based on mode
     if profile_type == 1:
-        draw_profile_table(overlay_surface, config, profile_data, profile_mode, symbols)
+        draw_profile_table(overlay_surface, config, profile_data, profile_mode, resolve_symbol)
     elif profile_type == 2:
-        draw_event_table(overlay_surface, config, profile_data, profile_mode, symbols)
+        draw_event_table(overlay_surface, config, profile_data, profile_mode, resolve_symbol)
     
+    draw_profile_overlay.overlay_data = profile_data
+    draw_profile_overlay.overlay_key = overlay_key
     screen.blit(overlay_surface, (0, 0))
 
-def pygame_test(port, script, poll_rate, scale, benchmark, symbols):
+def pygame_test(port, script, poll_rate, scale, benchmark, resolve_symbol):
     # init pygame
     pygame.init()
     pyopenmv.disconnect()
@@ -432,16 +613,19 @@ def pygame_test(port, script, poll_rate, scale, benchmark, symbols):
     # init screen
     running = True
     screen = None
+    image = None
 
     # Profiling control
     profile_type = 0
     profile_mode = 0
-    profile_data = []
+    profile_data = None
     last_profile_read = 0
     
     clock = pygame.time.Clock()
     fps_clock = pygame.time.Clock()
     font = pygame.font.SysFont("monospace", 30)
+    fps_text = None
+    fps_surface = None
 
     if not benchmark:
         pygame.display.set_caption("OpenMV Camera")
@@ -459,26 +643,31 @@ def pygame_test(port, script, poll_rate, scale, benchmark, symbols):
     
             # Read profiling data (maximum 10Hz)
             if profiling and profile_type:
-                current_time = time.time()
-                if current_time - last_profile_read >= 0.1:  # 10Hz = 0.1s interval
+                current_time = pygame.time.get_ticks()
+                if current_time - last_profile_read >= 100:  # 10Hz = 100ms interval
                     tmp_data = pyopenmv.read_profile()
                     if tmp_data:
-                        profile_data = tmp_data
+                        profile_data = profile_to_arrays(tmp_data)
                     last_profile_read = current_time
 
             #if profile_data:
-            #    for r in profile_data:
-            #        print(f"Func: {addr_to_symbol(symbols, r['address'])}@0x{r['address']:x} ")
-            #        print(f"Call: {addr_to_symbol(symbols, r['caller'])}@0x{r['caller']:x}")
+            #    for address, caller in zip(profile_data['address'].tolist(), profile_data['caller'].tolist()):
+            #        print(f"Func: {resolve_symbol(address)}@0x{address:x} ")
+            #        print(f"Call: {resolve_symbol(caller)}@0x{caller:x}")
             #    sys.exit(0)
 
             if data is not None:
                 fps = fps_clock.get_fps()
     
                 # Create image from RGB888
+                # Surfaces are only re-allocated when the frame size changes.
                 if not benchmark:
-                    image = pygame.image.frombuffer(data.flat[0:], (w, h), 'RGB')
-                    image = pygame.transform.smoothscale(image, (w * scale, h * scale))
+                    if image is None or image.get_size() != (w * scale, h * scale):
+                        image = pygame.Surface((w * scale, h * scale), depth=24)
+                    # Nearest-neighbour upscale straight into the surface pixels in one pass.
+                    pixels = pygame.surfarray.pixels3d(image)
+                    pixels.reshape(w, scale, h, scale, 3)[...] = data.swapaxes(0, 1)[:, None, :, None, :]
+                    del pixels # Unlock the surface.
     
                 if screen is None:
                     screen = pygame.display.set_mode((w * scale, h * scale), pygame.DOUBLEBUF, 32)
@@ -489,17 +678,20 @@ def pygame_test(port, script, poll_rate, scale, benchmark, symbols):
                 else:
                     screen.blit(image, (0, 0))
                 
-                # FPS text
-                fps_text = f"{fps:.2f} FPS {fps * size / 1024**2:.2f} MB/s {w}x{h} {fmt}"
-                screen.blit(font.render(fps_text, 5, (255, 0, 0)), (0, 0))
+                # FPS text (only re-rendered when the text changes)
+                fps_str = f"{fps:.2f} FPS {fps * size / 1024**2:.2f} MB/s {w}x{h} {fmt}"
+                if fps_str != fps_text:
+                    fps_text = fps_str
+                    fps_surface = font.render(fps_text, 5, (255, 0, 0))
+                screen.blit(fps_surface, (0, 0))
                 
                 # Draw profile overlay if enabled
                 if profile_type and profile_data:
-                    draw_profile_overlay(screen, w, h, profile_data, profile_mode, profile_type, scale, symbols)
+                    draw_profile_overlay(screen, w, h, profile_data, profile_mode, profile_type, scale, resolve_symbol)
     
                 # update display
                 pygame.display.flip()
-                fps_clock.tick(1000//poll_rate)
+                fps_clock.tick()
     
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -508,7 +700,9 @@ def pygame_test(port, script, poll_rate, scale, benchmark, symbols):
                     if event.key == pygame.K_ESCAPE:
                         running = False
                     elif event.key == pygame.K_c:
-                        pygame.image.save(image, "capture.png")
+                        # No frame surface exists yet (or at all in benchmark mode).
+                        if image is not None:
+                            pygame.image.save(image, "capture.png")
                     elif event.key == pygame.K_p:
                         profile_type = (profile_type + 1) % 3
                     elif event.key == pygame.K_m:
@@ -541,24 +735,9 @@ if __name__ == '__main__':
     else:
         args.script = bench_script if args.bench else test_script
 
-    symbols = []
+    resolve_symbol = None
 
     if args.firmware:
-        from elftools.elf.elffile import ELFFile
-    
-        with open(args.firmware, 'rb') as f:
-            elf = ELFFile(f)
-            symtab = elf.get_section_by_name('.symtab')
-            if not symtab:
-                raise ValueError("No symbol table found in ELF.")
-    
-            for sym in symtab.iter_symbols():
-                addr = sym['st_value']
-                size = sym['st_size']
-                name = sym.name
-                if name and size > 0:  # ignore empty symbols
-                    symbols.append((addr, addr + size, name))
-
-        symbols.sort()
+        resolve_symbol = symbol_resolver(load_symbols(args.firmware))
 
-    pygame_test(args.port, args.script, args.poll, args.scale, args.bench, symbols)
+    pygame_test(args.port, args.script, args.poll, args.scale, args.bench, resolve_symbol)